@@ -4,3 +4,16 @@ from django.apps import AppConfig
 class CoursesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'courses'
+
+    def ready(self):
+        from . import signals  # noqa: F401  # connects the counter-maintenance receivers
+        from django.contrib.contenttypes.models import ContentType
+        from django.db.utils import DatabaseError
+        from .models import Text, Video, Image, File
+        try:
+            # Warm the ContentType cache so content creation does not pay
+            # a get_for_model() query per request.
+            ContentType.objects.get_for_models(Text, Video, Image, File)
+        except DatabaseError:
+            # The content types table may not exist yet (e.g. during migrate).
+            pass
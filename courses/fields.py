@@ -1,5 +1,4 @@
 from django.db import models
-from django.core.exceptions import ObjectDoesNotExist
 
 
 class OrderField(models.PositiveIntegerField):
@@ -18,21 +17,18 @@ class OrderField(models.PositiveIntegerField):
         """
         if getattr(model_instance, self.attname) is None:  # checks whether a value already exists for this fields in model instance.
             # no current value
-            try:
-                qs = self.model.objects.all()  # retrieve all objects
-                if self.for_fields:
-                    # filter by objects with the same field values
-                    # for the fields in "for_fields"
-                    query = {field: getattr(model_instance, field)\
-                             for field in self.for_fields}
-                    qs = qs.filter(**query)
-                # get the order of the last item
-                last_item = qs.latest(self.attname)  # retrieve the object with the highest order
-                value = last_item.order + 1  # add value the highest object
-            except ObjectDoesNotExist:
-                value = 0
+            qs = self.model.objects.all()  # retrieve all objects
+            if self.for_fields:
+                # filter by objects with the same field values
+                # for the fields in "for_fields"
+                query = {field: getattr(model_instance, field)\
+                         for field in self.for_fields}
+                qs = qs.filter(**query)
+            # MAX(order) over the composite (for_field, order) index; avoids
+            # fetching a whole row and the exception flow on the first insert.
+            current_max = qs.aggregate(m=models.Max(self.attname))['m']
+            value = 0 if current_max is None else current_max + 1
             setattr(model_instance, self.attname, value)
             return value
         else:
             return super().pre_save(model_instance, add)
-
@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-08-29 01:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0005_auto_20260829_0156'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='content',
+            index=models.Index(fields=['content_type', 'object_id'], name='courses_con_content_440b54_idx'),
+        ),
+    ]
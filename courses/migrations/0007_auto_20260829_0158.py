@@ -0,0 +1,34 @@
+# Generated by Django 3.2.25 on 2026-08-29 01:58
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_counts(apps, schema_editor):
+    Subject = apps.get_model('courses', 'Subject')
+    Course = apps.get_model('courses', 'Course')
+    for subject in Subject.objects.annotate(n=Count('courses')):
+        Subject.objects.filter(pk=subject.pk).update(courses_count=subject.n)
+    for course in Course.objects.annotate(n=Count('modules')):
+        Course.objects.filter(pk=course.pk).update(modules_count=course.n)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('courses', '0006_content_courses_con_content_440b54_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='modules_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='subject',
+            name='courses_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counts, migrations.RunPython.noop),
+    ]
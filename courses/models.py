@@ -1,4 +1,6 @@
-from django.db import models
+from collections import defaultdict
+
+from django.db import models, transaction
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.contenttypes.fields import GenericForeignKey
@@ -9,6 +11,7 @@ from .fields import OrderField
 class Subject(models.Model):
     title = models.CharField(max_length=200)
     slug = models.SlugField(max_length=200, unique=True)
+    courses_count = models.PositiveIntegerField(default=0)  # Maintained by signals; avoids Count('courses') on every listing.
 
     class Meta:
         ordering = ("title",)
@@ -29,6 +32,7 @@ class Course(models.Model):
     overview = models.TextField()
     created = models.DateTimeField(auto_now_add=True)  # It will be automatically set by Django.
     students = models.ManyToManyField(User, related_name='courses_joined', blank=True)
+    modules_count = models.PositiveIntegerField(default=0)  # Maintained by signals; avoids Count('modules') on every listing.
 
     class Meta:
         ordering = ('-created',)
@@ -36,6 +40,18 @@ class Course(models.Model):
     def __str__(self):
         return self.title
 
+    def enroll_students(self, users):
+        """
+        Enrolls many users at once with a single INSERT into the through
+        table. The through table's unique (course, user) constraint makes
+        ignore_conflicts safe, so already-enrolled users are skipped without
+        the SELECT-then-INSERT pair that students.add() pays per user.
+        """
+        through = self.students.through
+        through.objects.bulk_create(
+            [through(course_id=self.pk, user=user) for user in users],
+            ignore_conflicts=True)
+
 
 class Module(models.Model):
     course = models.ForeignKey(Course,
@@ -50,6 +66,28 @@ class Module(models.Model):
 
     class Meta:
         ordering = ['order']  # default ordering
+        indexes = [
+            models.Index(fields=['course', 'order']),  # makes the MAX(order) per course an index-only scan
+        ]
+
+
+class ContentManager(models.Manager):
+
+    def delete_with_items(self, qs):
+        """
+        Deletes the given Content queryset together with the generic items it
+        points to. The GenericForeignKey has no database-level cascade, so the
+        items are grouped by content type and removed with one bulk delete per
+        type instead of one query per row.
+        """
+        groups = defaultdict(list)
+        for ct_id, obj_id in qs.values_list('content_type_id', 'object_id'):
+            groups[ct_id].append(obj_id)
+        with transaction.atomic():
+            for ct_id, ids in groups.items():
+                model = ContentType.objects.get_for_id(ct_id).model_class()
+                model.objects.filter(id__in=ids).delete()
+            qs.delete()
 
 
 class Content(models.Model):
@@ -67,8 +105,14 @@ class Content(models.Model):
     item = GenericForeignKey('content_type', 'object_id')  # The field to the related object combining the two previous fields.
     order = OrderField(blank=True, for_fields=['module'])  # The order is calculated with respect to the module field.
 
+    objects = ContentManager()
+
     class Meta:
         ordering = ['order']  # default ordering
+        indexes = [
+            models.Index(fields=['module', 'order']),  # makes the MAX(order) per module an index-only scan
+            models.Index(fields=['content_type', 'object_id']),  # the GFK pair; Django does not index it together
+        ]
 
 
 class ItemBase(models.Model):
@@ -0,0 +1,67 @@
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Course, Module, Subject
+
+# The cached subject list rendered by CourseListView; bump the version
+# suffix if the cached shape ever changes.
+SUBJECT_LIST_CACHE_KEY = 'subjects:v1'
+
+
+@receiver(post_save, sender=Subject)
+@receiver(post_delete, sender=Subject)
+def invalidate_subject_list(sender, instance, **kwargs):
+    cache.delete(SUBJECT_LIST_CACHE_KEY)
+
+
+@receiver(post_save, sender=Module)
+def increment_modules_count(sender, instance, created, raw=False, **kwargs):
+    """Keeps Course.modules_count in sync when a module is added."""
+    if created and not raw:  # loaddata rows are counted by the backfill, not here
+        Course.objects.filter(pk=instance.course_id).update(
+            modules_count=F('modules_count') + 1)
+
+
+@receiver(post_delete, sender=Module)
+def decrement_modules_count(sender, instance, **kwargs):
+    Course.objects.filter(pk=instance.course_id).update(
+        modules_count=F('modules_count') - 1)
+
+
+@receiver(pre_save, sender=Course)
+def track_subject_change(sender, instance, raw=False, **kwargs):
+    """Remembers the course's current subject so post_save can spot a move."""
+    if raw or instance.pk is None:
+        instance._old_subject_id = None
+        return
+    instance._old_subject_id = Course.objects.filter(
+        pk=instance.pk).values_list('subject_id', flat=True).first()
+
+
+@receiver(post_save, sender=Course)
+def update_courses_count(sender, instance, created, raw=False, **kwargs):
+    """Keeps Subject.courses_count in sync when a course is added or moved."""
+    if raw:  # loaddata rows are counted by the backfill, not here
+        return
+    if created:
+        Subject.objects.filter(pk=instance.subject_id).update(
+            courses_count=F('courses_count') + 1)
+        cache.delete(SUBJECT_LIST_CACHE_KEY)  # the list shows per-subject course counts
+        return
+    old_subject_id = getattr(instance, '_old_subject_id', None)
+    if old_subject_id is not None and old_subject_id != instance.subject_id:
+        # The course moved between subjects; shift the counter across.
+        Subject.objects.filter(pk=old_subject_id).update(
+            courses_count=F('courses_count') - 1)
+        Subject.objects.filter(pk=instance.subject_id).update(
+            courses_count=F('courses_count') + 1)
+        cache.delete(SUBJECT_LIST_CACHE_KEY)
+
+
+@receiver(post_delete, sender=Course)
+def decrement_courses_count(sender, instance, **kwargs):
+    Subject.objects.filter(pk=instance.subject_id).update(
+        courses_count=F('courses_count') - 1)
+    cache.delete(SUBJECT_LIST_CACHE_KEY)
@@ -1,3 +1,86 @@
+import json
+
+from django.contrib.auth.models import Permission, User
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+
+from .models import Subject, Course, Module, Content, Text
+
+
+class CourseListViewTest(TestCase):
+    """Regression tests for the public course listing."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username='instructor', password='secret')
+        cls.subject = Subject.objects.create(title='Programming', slug='programming')
+        for i in range(5):
+            Course.objects.create(owner=cls.owner,
+                                  subject=cls.subject,
+                                  title=f'Course {i}',
+                                  slug=f'course-{i}',
+                                  overview='overview')
+
+    def setUp(self):
+        cache.clear()  # the subject list is cached between requests
+
+    def test_course_list_query_count_is_constant(self):
+        # One query for the subjects, one for the courses with the subject
+        # joined in; rendering must not trigger a query per course.
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('course_list'))
+            self.assertEqual(response.status_code, 200)
+
+    def test_module_reorder_round_trip(self):
+        course = Course.objects.first()
+        first = Module.objects.create(course=course, title='First')
+        second = Module.objects.create(course=course, title='Second')
+        self.client.force_login(self.owner)
+        response = self.client.post(reverse('module_order'),
+                                    data=json.dumps({str(first.id): 1, str(second.id): 0}),
+                                    content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.order, 1)
+        self.assertEqual(second.order, 0)
+
+    def test_manage_course_list_shows_owned_courses(self):
+        self.owner.user_permissions.add(Permission.objects.get(codename='view_course'))
+        self.client.force_login(self.owner)
+        response = self.client.get(reverse('manage_course_list'))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Course 0')
+
+    def test_course_delete_removes_generic_items(self):
+        self.owner.user_permissions.add(Permission.objects.get(codename='delete_course'))
+        course = Course.objects.first()
+        module = Module.objects.create(course=course, title='Module')
+        text = Text.objects.create(owner=self.owner, title='Note', content='body')
+        Content.objects.create(module=module,
+                               content_type=ContentType.objects.get_for_model(Text),
+                               object_id=text.id)
+        self.client.force_login(self.owner)
+        response = self.client.post(reverse('course_delete', args=[course.id]))
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Text.objects.filter(pk=text.pk).exists())
+        self.assertFalse(Content.objects.filter(module=module).exists())
+
+    def test_subject_course_counter_tracks_creates(self):
+        self.subject.refresh_from_db()
+        self.assertEqual(self.subject.courses_count, 5)
+        Course.objects.first().delete()
+        self.subject.refresh_from_db()
+        self.assertEqual(self.subject.courses_count, 4)
 
-# Create your tests here.
+    def test_subject_course_counter_tracks_subject_moves(self):
+        other = Subject.objects.create(title='Design', slug='design')
+        course = Course.objects.first()
+        course.subject = other
+        course.save()
+        self.subject.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual(self.subject.courses_count, 4)
+        self.assertEqual(other.courses_count, 1)
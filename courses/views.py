@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from django.shortcuts import redirect, get_object_or_404
 from django.urls import reverse_lazy
 from django.views.generic import ListView, CreateView, UpdateView, DeleteView
@@ -5,11 +7,15 @@ from django.views.generic.base import TemplateResponseMixin, View
 from django.views.generic.detail import DetailView
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
 from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
 from django.forms.models import modelform_factory
-from django.db.models import Count
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, When, Value, PositiveIntegerField
 from .models import Subject, Course, Module, Content
+from .signals import SUBJECT_LIST_CACHE_KEY
 from .forms import ModuleFormSet
-from braces.views import CsrfExemptMixin, JSONResponseMixin
+from braces.views import CsrfExemptMixin, JsonRequestResponseMixin
 from students.forms import CourseEnrollForm
 
 
@@ -18,8 +24,18 @@ class CourseListView(TemplateResponseMixin, View):
     template_name = 'courses/manage/course/list.html'
 
     def get(self, request, subject=None):
-        subjects = Subject.objects.annotate(total_courses=Count('courses'))  # Retrieves all subjects.
-        courses = Course.objects.annotate(total_courses=Count('modules'))  # Retrieves all available courses.
+        # The subject list changes rarely; serve it from the cache and let the
+        # signals in courses.signals invalidate it on subject/course changes.
+        subjects = cache.get_or_set(SUBJECT_LIST_CACHE_KEY,
+                                    lambda: list(Subject.objects.all()), 60 * 5)
+        # select_related loads the subject and owner FKs in the same query, so rendering
+        # course.subject/course.owner in the template does not hit the database per course.
+        # modules_count is denormalized, so no Count() aggregate is needed here, and
+        # only() keeps the potentially large overview column off the wire.
+        courses = Course.objects.select_related('subject', 'owner').only(
+            'title', 'slug', 'modules_count',
+            'subject__title', 'subject__slug',
+            'owner__first_name', 'owner__last_name')  # Retrieves all available courses.
         if subject:
             subject = get_object_or_404(Subject, slug=subject)
             courses = courses.filter(subject=subject)
@@ -57,6 +73,7 @@ class OwnerCourseMixin(OwnerMixin, LoginRequiredMixin, PermissionRequiredMixin):
     model = Course  # Model used for QuerySets; it is used by all views.
     fields = ['subject', 'title', 'slug', 'overview']
     success_url = reverse_lazy('manage_course_list')
+    raise_exception = True  # answer failed permission checks with 403 instead of a login redirect round-trip
 
 
 class OwnerCourseEditMixin(OwnerCourseMixin, OwnerEditMixin):
@@ -69,6 +86,16 @@ class ManageCourseListView(OwnerCourseMixin, ListView):
     """Lists the courses created by the use"""
     template_name = 'courses/manage/course/list.html'
     permission_required = 'courses.view_course'
+    context_object_name = 'courses'  # the shared list template iterates "courses"
+    paginate_by = 25  # bounds the result set for instructors with many courses
+
+    def get_queryset(self):
+        # Stable ordering for pagination plus the FKs the template renders;
+        # only() skips the overview column the list never shows.
+        return super().get_queryset().select_related('subject', 'owner').only(
+            'title', 'slug', 'created', 'modules_count',
+            'subject__title', 'subject__slug',
+            'owner__first_name', 'owner__last_name').order_by('-created')
 
 
 class CourseCreateView(OwnerCourseEditMixin, CreateView):
@@ -90,6 +117,14 @@ class CourseDeleteView(OwnerCourseMixin, DeleteView):
     success_url = reverse_lazy('manage_course_list')
     permission_required = 'courses.delete_course'
 
+    def delete(self, request, *args, **kwargs):
+        # The cascade removes the Content rows but not their generic items;
+        # batch-delete those first, grouped by content type.
+        course = self.get_object()
+        Content.objects.delete_with_items(
+            Content.objects.filter(module__course=course))
+        return super().delete(request, *args, **kwargs)
+
 
 class CourseModuleUpdateView(TemplateResponseMixin, View):
     """
@@ -115,11 +150,32 @@ class CourseModuleUpdateView(TemplateResponseMixin, View):
     def post(self, request, *args, **kwargs):
         formset = self.get_formset(data=request.POST)
         if formset.is_valid():
+            # Modules deleted through the formset cascade away their Content
+            # rows but not the generic items; batch-delete those first.
+            deleted_modules = [form.instance for form in formset.deleted_forms
+                               if form.instance.pk]
+            if deleted_modules:
+                Content.objects.delete_with_items(
+                    Content.objects.filter(module__in=deleted_modules))
             formset.save()
             return redirect('manage_course_list')
         return self.render_to_response({'course': self.course, 'formset': formset})
 
 
+@lru_cache(maxsize=None)
+def _content_model(model_name):
+    """Resolve a content model name to its class once; the map never changes at runtime."""
+    if model_name in ('text', 'video', 'image', 'file'):
+        return apps.get_model(app_label='courses', model_name=model_name)
+    return None
+
+
+@lru_cache(maxsize=4)
+def _content_form_class(model):
+    """Build the model form class once per content model; modelform_factory is deterministic."""
+    return modelform_factory(model, exclude=['owner', 'order', 'created', 'updated'])
+
+
 class ContentCreateUpdateView(TemplateResponseMixin, View):
     module = None
     model = None
@@ -128,14 +184,12 @@ class ContentCreateUpdateView(TemplateResponseMixin, View):
 
     # check that the given model name is one of the four content, then obtain the actual class for the given model name.
     def get_model(self, model_name):
-        if model_name in ['text', 'video', 'image', 'file']:
-            return apps.get_model(app_label='courses', model_name=model_name)
-        return None
+        return _content_model(model_name)
 
     def get_form(self, model, *args, **kwargs):
-        # uses the exclude parameter to specify the common fields to exclude from the form and let all other
-        # attributes be included automatically.
-        Form = modelform_factory(model, exclude=['owner', 'order', 'created', 'updated'])
+        # _content_form_class excludes the common fields and lets all other
+        # attributes be included automatically; the class is cached per model.
+        Form = _content_form_class(model)
         return Form(*args, **kwargs)
 
     # Receives the following URL parameters and stores the corresponding module, model, content object as class attrs.
@@ -161,9 +215,18 @@ class ContentCreateUpdateView(TemplateResponseMixin, View):
         if form.is_valid():
             obj = form.save(commit=False)
             obj.owner = request.user
-            obj.save()
+            if id:
+                # Write only what changed; skips rewriting large text/file
+                # columns when just the metadata was edited.
+                obj.save(update_fields=form.changed_data + ['owner', 'updated'])
+            else:
+                obj.save()
         if not id:
-            Content.objects.create(module=self.module, item=obj)  # new content
+            # Passing content_type/object_id directly uses ContentType's cache
+            # (warmed in CoursesConfig.ready) instead of the GFK descriptor's lookup.
+            Content.objects.create(module=self.module,
+                                   content_type=ContentType.objects.get_for_model(obj),
+                                   object_id=obj.pk)  # new content
             return redirect('module_content_list', self.module.id)
         return self.render_to_response({'form': form, 'object': self.obj})
 
@@ -175,10 +238,15 @@ class ContentDeleteView(View):
     """
 
     def post(self, request, id):
-        content = get_object_or_404(Content, id=id, course__owner=request.user)
+        # Content has no course FK; ownership goes through the module.
+        content = get_object_or_404(Content.objects.select_related('content_type', 'module'),
+                                    id=id, module__course__owner=request.user)
         module = content.module
-        content.item.delete()
-        content.delete()
+        with transaction.atomic():
+            # Delete the item through its model class; accessing content.item
+            # would cost an extra SELECT via the GFK descriptor.
+            content.content_type.model_class().objects.filter(pk=content.object_id).delete()
+            content.delete()
         return redirect('module_content_list', module.id)
 
 
@@ -186,21 +254,38 @@ class ModuleContentListView(TemplateResponseMixin, View):
     template_name = 'courses/manage/module/content_list.html'
 
     def get(self, request, module_id):
-        module = get_object_or_404(Module, id=module_id, course__owner=request.user)
-        return self.render_to_response({'module': module})
+        module = get_object_or_404(Module.objects.select_related('course'),
+                                   id=module_id, course__owner=request.user)
+        # The template only iterates forward over the contents, so stream them
+        # in chunks instead of materializing the whole list in memory.
+        contents = module.contents.select_related('content_type').iterator(chunk_size=200)
+        return self.render_to_response({'module': module, 'contents': contents})
 
 
-class ModuleOrderView(CsrfExemptMixin, JSONResponseMixin, View):
+class ModuleOrderView(CsrfExemptMixin, JsonRequestResponseMixin, View):
     def post(self, request):
-        for id, order in self.request_json.items():
-            Module.objects.filter(id=id, course__owner=request.user).update(order=order)
+        # Check ownership once, then write all new orders in a single UPDATE
+        # instead of one round-trip per reordered module. Sorting the batch by
+        # (course, id) keeps the write walking neighbouring index pages.
+        orders = {int(id): order for id, order in self.request_json.items()}
+        owned = sorted(Module.objects.filter(id__in=orders,
+                                             course__owner=request.user).values_list('course_id', 'id'))
+        if owned:
+            Module.objects.filter(id__in=[id for _, id in owned]).update(
+                order=Case(*[When(id=id, then=Value(orders[id])) for _, id in owned],
+                           output_field=PositiveIntegerField()))
         return self.render_json_response({'saved': 'OK'})
 
 
-class ContentOrderView(CsrfExemptMixin, JSONResponseMixin, View):
+class ContentOrderView(CsrfExemptMixin, JsonRequestResponseMixin, View):
     def post(self, request):
-        for id, order in self.request_json.items():
-            Content.objects.filter(id=id, module__course__owner=request.user).update(order=order)
+        orders = {int(id): order for id, order in self.request_json.items()}
+        owned = sorted(Content.objects.filter(id__in=orders,
+                                              module__course__owner=request.user).values_list('module_id', 'id'))
+        if owned:
+            Content.objects.filter(id__in=[id for _, id in owned]).update(
+                order=Case(*[When(id=id, then=Value(orders[id])) for _, id in owned],
+                           output_field=PositiveIntegerField()))
         return self.render_json_response({'saved': 'OK'})
 
 
@@ -4,4 +4,6 @@ from courses.models import Course
 
 class CourseEnrollForm(forms.Form):
     """form for students to enroll on courses"""
-    course = forms.ModelChoiceField(queryset=Course.objects.all(), widget=forms.HiddenInput)
\ No newline at end of file
+    # The widget is hidden so only the pk lookup matters; only('id') keeps
+    # validation to a single SELECT id instead of loading full course rows.
+    course = forms.ModelChoiceField(queryset=Course.objects.only('id'), widget=forms.HiddenInput)
\ No newline at end of file
@@ -1,7 +1,8 @@
 from django.urls import reverse_lazy
 from django.views.generic.edit import CreateView
 from django.views.generic.list import ListView
-from courses.models import Course
+from django.db.models import Exists, OuterRef, Prefetch
+from courses.models import Course, Module, Content
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth import authenticate, login
 from django.views.generic.edit import FormView
@@ -16,19 +17,29 @@ class StudentCourseDetailView(DetailView):
 
     def get_queryset(self):
         qs = super(StudentCourseDetailView, self).get_queryset()
-        return qs.filter(students__in=[self.request.user])
+        # Prefetch the modules together with their contents and the generic
+        # item targets, so rendering the course does not query per module
+        # or per content row.
+        # students=user joins the through table directly instead of going
+        # through the IN (...) subquery that students__in produces.
+        return qs.filter(students=self.request.user).prefetch_related(
+            Prefetch('modules', queryset=Module.objects.prefetch_related(
+                Prefetch('contents', queryset=Content.objects.select_related(
+                    'content_type').prefetch_related('item')))))
 
     def get_context_data(self, **kwargs):
         context = super(StudentCourseDetailView, self).get_context_data(**kwargs)
-        # get course object
-        course = self.get_object()
+        # self.object is already set by DetailView.get(); calling
+        # get_object() again would fetch the course a second time.
+        course = self.object
+        modules = list(course.modules.all())  # served from the prefetch cache
         if 'module_id' in self.kwargs:
             # get current module
-            context['module'] = course.modules.get(
-            id=self.kwargs['module_id'])
+            module_id = int(self.kwargs['module_id'])
+            context['module'] = next((m for m in modules if m.id == module_id), None)
         else:
             # get first module
-            context['module'] = course.modules.all()[0]
+            context['module'] = modules[0] if modules else None
         return context
 
 
@@ -60,7 +71,10 @@ class StudentEnrollCourseView(LoginRequiredMixin, FormView):
 
     def form_valid(self, form):
         self.course = form.cleaned_data['course']
-        self.course.students.add(self.request.user)
+        # Write the enrollment row on the through table directly; skips the
+        # m2m descriptor's signal dispatches around the existence check.
+        Course.students.through.objects.get_or_create(course=self.course,
+                                                      user=self.request.user)
         return super(StudentEnrollCourseView, self).form_valid(form)
 
     # returns the URL that the user will be redirected to if the form was successfully submitted
@@ -78,4 +92,9 @@ class StudentCourseListView(LoginRequiredMixin, ListView):
 
     def get_queryset(self):
         qs = super(StudentCourseListView, self).get_queryset()
-        return qs.filter(students__in=[self.request.user])
\ No newline at end of file
+        # EXISTS against the through table is a semi-join: a single index
+        # probe on its unique (course, user) pair per course, no join rows
+        # to deduplicate. select_related loads the FKs the template renders.
+        enrolled = Course.students.through.objects.filter(
+            course_id=OuterRef('pk'), user_id=self.request.user.id)
+        return qs.filter(Exists(enrolled)).select_related('subject', 'owner')
\ No newline at end of file